@@ -1,6 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import socket
+import sys
+
+# Двоичные записи всех возможных октетов: _BIN8[n] == "{n:08b}"
+_BIN8 = tuple(format(i, '08b') for i in range(256))
+
+# Обратная таблица: двоичная запись октета -> его десятичная запись
+_BIN8_REV = {_BIN8[i]: str(i) for i in range(256)}
+
 def decimal_to_binary(ip_address):
     """
     Преобразует IP-адрес из десятичного формата в двоичный.
@@ -20,25 +29,36 @@ def decimal_to_binary(ip_address):
     
     binary_octets = []
     for octet in octets:
-        try:
-            # Проверяем, что октет является числом от 0 до 255
-            decimal_octet = int(octet)
-            if decimal_octet < 0 or decimal_octet > 255:
-                return f"Ошибка: Каждый октет должен быть числом от 0 до 255. Получено: {octet}"
-            
-            # Преобразуем десятичное число в двоичное и удаляем префикс '0b'
-            binary_octet = bin(decimal_octet)[2:]
-            
-            # Дополняем нулями слева до 8 бит
-            binary_octet = binary_octet.zfill(8)
-            
-            binary_octets.append(binary_octet)
-        except ValueError:
+        # Проверяем, что октет состоит только из цифр, без обработки исключений
+        if not octet.isdecimal():
             return f"Ошибка: Невозможно преобразовать '{octet}' в число."
+        
+        # Проверяем, что октет является числом от 0 до 255
+        decimal_octet = int(octet)
+        if decimal_octet > 255:
+            return f"Ошибка: Каждый октет должен быть числом от 0 до 255. Получено: {octet}"
+        
+        # Берем готовую 8-битную двоичную запись из таблицы
+        binary_octets.append(_BIN8[decimal_octet])
     
     # Объединяем октеты с помощью точки
     return ".".join(binary_octets)
 
+def _decimal_to_binary_unchecked(ip_address):
+    """
+    Преобразует IP-адрес из десятичного формата в двоичный без проверки.
+    
+    Вызывающий код должен заранее убедиться, что адрес корректный
+    (например, validate_ip_format() вернула "decimal").
+    
+    Аргументы:
+        ip_address (str): Корректный IP-адрес в десятичном формате
+    
+    Возвращает:
+        str: IP-адрес в двоичном формате
+    """
+    return ".".join(_BIN8[int(octet)] for octet in ip_address.split("."))
+
 def binary_to_decimal(ip_address):
     """
     Преобразует IP-адрес из двоичного формата в десятичный.
@@ -49,7 +69,18 @@ def binary_to_decimal(ip_address):
     Возвращает:
         str: IP-адрес в десятичном формате (например, "192.168.1.1")
     """
-    # Разделяем IP-адрес на октеты
+    # Быстрый путь: корректная запись имеет фиксированную длину 35 символов
+    # с точками на позициях 8, 17 и 26. Поиск в _BIN8_REV одновременно
+    # проверяет октет и преобразует его в десятичную запись
+    if len(ip_address) == 35 and ip_address[8] == ip_address[17] == ip_address[26] == ".":
+        first = _BIN8_REV.get(ip_address[0:8])
+        second = _BIN8_REV.get(ip_address[9:17])
+        third = _BIN8_REV.get(ip_address[18:26])
+        fourth = _BIN8_REV.get(ip_address[27:35])
+        if first and second and third and fourth:
+            return f"{first}.{second}.{third}.{fourth}"
+    
+    # Иначе разбираем по октетам, чтобы сообщить, какой из них неверный
     octets = ip_address.split(".")
     
     # Проверяем, что IP-адрес состоит из 4 октетов
@@ -58,56 +89,135 @@ def binary_to_decimal(ip_address):
     
     decimal_octets = []
     for octet in octets:
-        # Проверяем, что октет содержит только 0 и 1 и имеет длину 8
-        if not all(bit in '01' for bit in octet) or len(octet) != 8:
+        # Находим десятичную запись октета; в таблице есть только
+        # строки ровно из 8 бит (0 или 1)
+        decimal_octet = _BIN8_REV.get(octet)
+        if decimal_octet is None:
             return f"Ошибка: Каждый двоичный октет должен содержать ровно 8 бит (0 или 1). Получено: {octet}"
         
-        # Преобразуем двоичное число в десятичное
-        decimal_octet = int(octet, 2)
-        decimal_octets.append(str(decimal_octet))
+        decimal_octets.append(decimal_octet)
     
     # Объединяем октеты с помощью точки
     return ".".join(decimal_octets)
 
-def validate_ip_format(ip_address):
+def _parse_ipv4_decimal(ip_address):
     """
-    Определяет формат введенного IP-адреса (десятичный или двоичный).
+    Разбирает IP-адрес в десятичном формате в 32-битное целое число.
     
     Аргументы:
-        ip_address (str): IP-адрес в любом формате
+        ip_address (str): IP-адрес в десятичном формате (например, "192.168.1.1")
     
     Возвращает:
-        str: "decimal", "binary" или "invalid"
+        int: IP-адрес как 32-битное целое число или None, если формат неверный
+    """
+    # Быстрый путь: разбор на C через socket.inet_aton(). Результат принимается,
+    # только если обратное преобразование дает исходную строку: inet_aton()
+    # понимает и восьмеричную, и сокращенную записи, которые мы трактуем иначе
+    try:
+        packed = socket.inet_aton(ip_address)
+        if socket.inet_ntoa(packed) == ip_address:
+            return int.from_bytes(packed, "big")
+    except (OSError, ValueError):
+        pass
+    
+    # Разбираем строку за один проход по ее байтам, без split() и int().
+    # Символы вне ASCII заменяются на '?' и отклоняются как неверные
+    ip_int = 0  # Уже разобранные октеты
+    octet = 0   # Значение текущего октета
+    digits = 0  # Количество цифр в текущем октете
+    dots = 0    # Количество встреченных точек
+    
+    for byte in ip_address.encode('ascii', 'replace'):
+        if 48 <= byte <= 57:  # '0' - '9'
+            octet = octet * 10 + (byte - 48)
+            digits += 1
+            # Октет должен быть числом от 0 до 255 и содержать не более 3 цифр
+            if octet > 255 or digits > 3:
+                return None
+        elif byte == 46:  # '.'
+            dots += 1
+            # Точек не больше трех, и каждой должен предшествовать непустой октет
+            if dots > 3 or digits == 0:
+                return None
+            ip_int = (ip_int << 8) | octet
+            octet = 0
+            digits = 0
+        else:
+            return None
+    
+    # Проверяем, что IP-адрес состоит из 4 непустых октетов
+    if dots != 3 or digits == 0:
+        return None
+    
+    return (ip_int << 8) | octet
+
+def _is_binary_ipv4(ip_address):
+    """
+    Проверяет, что IP-адрес записан в двоичном формате.
+    
+    Аргументы:
+        ip_address (str): IP-адрес (например, "11000000.10101000.00000001.00000001")
+    
+    Возвращает:
+        bool: True, если каждый из 4 октетов содержит ровно 8 бит (0 или 1)
     """
     octets = ip_address.split(".")
     
     # Проверяем, что IP-адрес состоит из 4 октетов
     if len(octets) != 4:
-        return "invalid"
-    
-    # Проверяем формат
-    is_decimal = True
-    is_binary = True
+        return False
     
+    # Прекращаем проверку на первом неверном октете; в _BIN8_REV есть
+    # только строки ровно из 8 бит (0 или 1)
     for octet in octets:
-        # Проверка для десятичного формата
-        try:
-            decimal_value = int(octet)
-            if decimal_value < 0 or decimal_value > 255:
-                is_decimal = False
-        except ValueError:
-            is_decimal = False
-        
-        # Проверка для двоичного формата
-        if not all(bit in '01' for bit in octet) or len(octet) != 8:
-            is_binary = False
+        if octet not in _BIN8_REV:
+            return False
     
-    if is_decimal:
+    return True
+
+def validate_ip_format(ip_address):
+    """
+    Определяет формат введенного IP-адреса (десятичный или двоичный).
+    
+    Аргументы:
+        ip_address (str): IP-адрес в любом формате
+    
+    Возвращает:
+        str: "decimal", "binary" или "invalid"
+    """
+    # Сначала проверяем десятичный формат, и только если он не подошел - двоичный
+    if _parse_ipv4_decimal(ip_address) is not None:
         return "decimal"
-    elif is_binary:
+    if _is_binary_ipv4(ip_address):
         return "binary"
-    else:
-        return "invalid"
+    return "invalid"
+
+def decimal_to_binary_batch(ip_addresses):
+    """
+    Преобразует список IP-адресов из десятичного формата в двоичный.
+    
+    Аргументы:
+        ip_addresses (list): IP-адреса в десятичном формате
+    
+    Возвращает:
+        list: IP-адреса в двоичном формате (или сообщения об ошибках) в том же порядке
+    """
+    binary_ips = []
+    for ip_address in ip_addresses:
+        ip_int = _parse_ipv4_decimal(ip_address)
+        
+        if ip_int is None:
+            # Неверный адрес - получаем сообщение об ошибке от обычной функции
+            binary_ips.append(decimal_to_binary(ip_address))
+            continue
+        
+        # Собираем двоичную запись из таблицы по октетам 32-битного числа
+        binary_ips.append(
+            f"{_BIN8[ip_int >> 24]}.{_BIN8[(ip_int >> 16) & 255]}."
+            f"{_BIN8[(ip_int >> 8) & 255]}.{_BIN8[ip_int & 255]}"
+        )
+    
+    return binary_ips
 
 def main():
     """
@@ -130,8 +240,9 @@ def main():
         ip_format = validate_ip_format(user_input)
         
         if ip_format == "decimal":
-            # Если формат десятичный, преобразуем в двоичный
-            binary_ip = decimal_to_binary(user_input)
+            # Если формат десятичный, преобразуем в двоичный; адрес уже
+            # проверен, поэтому повторная проверка не нужна
+            binary_ip = _decimal_to_binary_unchecked(user_input)
             print(f"\nДесятичная запись: {user_input}")
             print(f"Двоичная запись:   {binary_ip}")
         
@@ -149,9 +260,12 @@ def main():
 
 # Проверим работу программы на примерах из задания №1
 def verify_examples():
-    print("\n" + "=" * 60)
-    print("Проверка примеров из задания №1")
-    print("=" * 60)
+    # Собираем строки и выводим их одной записью в stdout
+    parts = [
+        "\n" + "=" * 60,
+        "Проверка примеров из задания №1",
+        "=" * 60,
+    ]
     
     # Двоичные IP-адреса из задания
     binary_ips = [
@@ -162,8 +276,8 @@ def verify_examples():
     
     for i, binary_ip in enumerate(binary_ips, 1):
         decimal_ip = binary_to_decimal(binary_ip)
-        print(f"{i}) Двоичная запись:   {binary_ip}")
-        print(f"   Десятичная запись: {decimal_ip}\n")
+        parts.append(f"{i}) Двоичная запись:   {binary_ip}")
+        parts.append(f"   Десятичная запись: {decimal_ip}\n")
     
     # Десятичные IP-адреса из задания
     decimal_ips = [
@@ -171,10 +285,13 @@ def verify_examples():
         "154.246.184.244"
     ]
     
-    for i, decimal_ip in enumerate(decimal_ips, 4):
-        binary_ip = decimal_to_binary(decimal_ip)
-        print(f"{i}) Десятичная запись: {decimal_ip}")
-        print(f"   Двоичная запись:   {binary_ip}\n")
+    binary_results = decimal_to_binary_batch(decimal_ips)
+    
+    for i, (decimal_ip, binary_ip) in enumerate(zip(decimal_ips, binary_results), 4):
+        parts.append(f"{i}) Десятичная запись: {decimal_ip}")
+        parts.append(f"   Двоичная запись:   {binary_ip}\n")
+    
+    sys.stdout.write("\n".join(parts) + "\n")
 
 if __name__ == "__main__":
     # Запуск проверки примеров
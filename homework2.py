@@ -1,6 +1,61 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import socket
+import sys
+from functools import lru_cache
+
+def _parse_ipv4(ip_address):
+    """
+    Разбирает IP-адрес в 32-битное целое число.
+    
+    Аргументы:
+        ip_address (str): IP-адрес в десятичном формате (например, "192.168.1.1")
+    
+    Возвращает:
+        int: IP-адрес как 32-битное целое число или None, если IP-адрес некорректный
+    """
+    # Быстрый путь: разбор на C через socket.inet_aton(). Результат принимается,
+    # только если обратное преобразование дает исходную строку: inet_aton()
+    # понимает и восьмеричную, и сокращенную записи, которые мы трактуем иначе
+    try:
+        packed = socket.inet_aton(ip_address)
+        if socket.inet_ntoa(packed) == ip_address:
+            return int.from_bytes(packed, "big")
+    except (OSError, ValueError):
+        pass
+    
+    # Разбираем строку за один проход по ее байтам, без split() и int().
+    # Символы вне ASCII заменяются на '?' и отклоняются как неверные
+    ip_int = 0  # Уже разобранные октеты
+    octet = 0   # Значение текущего октета
+    digits = 0  # Количество цифр в текущем октете
+    dots = 0    # Количество встреченных точек
+    
+    for byte in ip_address.encode('ascii', 'replace'):
+        if 48 <= byte <= 57:  # '0' - '9'
+            octet = octet * 10 + (byte - 48)
+            digits += 1
+            # Октет должен быть числом от 0 до 255 и содержать не более 3 цифр
+            if octet > 255 or digits > 3:
+                return None
+        elif byte == 46:  # '.'
+            dots += 1
+            # Точек не больше трех, и каждой должен предшествовать непустой октет
+            if dots > 3 or digits == 0:
+                return None
+            ip_int = (ip_int << 8) | octet
+            octet = 0
+            digits = 0
+        else:
+            return None
+    
+    # Проверяем, что IP-адрес состоит из 4 непустых октетов
+    if dots != 3 or digits == 0:
+        return None
+    
+    return (ip_int << 8) | octet
+
 def validate_ip(ip_address):
     """
     Проверяет корректность IP-адреса.
@@ -11,53 +66,39 @@ def validate_ip(ip_address):
     Возвращает:
         bool: True, если IP-адрес корректный, иначе False
     """
-    # Разделяем IP-адрес на октеты
-    octets = ip_address.split(".")
-    
-    # Проверяем, что IP-адрес состоит из 4 октетов
-    if len(octets) != 4:
-        return False
-    
-    # Проверяем, что каждый октет является числом от 0 до 255
-    for octet in octets:
-        try:
-            value = int(octet)
-            if value < 0 or value > 255:
-                return False
-        except ValueError:
-            return False
-    
-    return True
+    return _parse_ipv4(ip_address) is not None
+
+# Таблица классов IP-адресов, индексируемая первым октетом:
+# _CLASS_TABLE[первый октет] = (класс сети, префикс маски подсети по умолчанию)
+_CLASS_TABLE = [None] * 256
+_CLASS_TABLE[0] = ("Неизвестный", 0)
+for _octet in range(1, 127):  # 0XXXXXXX - 0XXXXXXX
+    _CLASS_TABLE[_octet] = ("A", 8)
+_CLASS_TABLE[127] = ("Loopback", 8)
+for _octet in range(128, 192):  # 10XXXXXX - 10XXXXXX
+    _CLASS_TABLE[_octet] = ("B", 16)
+for _octet in range(192, 224):  # 110XXXXX - 110XXXXX
+    _CLASS_TABLE[_octet] = ("C", 24)
+for _octet in range(224, 240):  # 1110XXXX - 1110XXXX
+    _CLASS_TABLE[_octet] = ("D", 0)  # Для мультивещательных адресов не применяется стандартная маска
+for _octet in range(240, 256):  # 1111XXXX - 1111XXXX
+    _CLASS_TABLE[_octet] = ("E", 0)  # Для экспериментальных адресов не применяется стандартная маска
+del _octet
 
-def determine_ip_class(ip_address):
+def determine_ip_class(ip_int):
     """
     Определяет класс IP-адреса.
     
     Аргументы:
-        ip_address (str): IP-адрес
+        ip_int (int): IP-адрес как 32-битное целое число
     
     Возвращает:
         tuple: (класс сети, префикс маски подсети по умолчанию)
     """
-    # Получаем первый октет
-    first_octet = int(ip_address.split(".")[0])
-    
-    # Определяем класс IP-адреса
-    if 1 <= first_octet <= 126:  # 0XXXXXXX - 0XXXXXXX
-        return "A", 8
-    elif 128 <= first_octet <= 191:  # 10XXXXXX - 10XXXXXX
-        return "B", 16
-    elif 192 <= first_octet <= 223:  # 110XXXXX - 110XXXXX
-        return "C", 24
-    elif 224 <= first_octet <= 239:  # 1110XXXX - 1110XXXX
-        return "D", 0  # Для мультивещательных адресов не применяется стандартная маска
-    elif 240 <= first_octet <= 255:  # 1111XXXX - 1111XXXX
-        return "E", 0  # Для экспериментальных адресов не применяется стандартная маска
-    elif first_octet == 127:
-        return "Loopback", 8
-    else:
-        return "Неизвестный", 0
+    # Класс зависит только от первого октета
+    return _CLASS_TABLE[ip_int >> 24]
 
+@lru_cache(maxsize=None)
 def get_subnet_mask(prefix):
     """
     Возвращает маску подсети в десятичном формате на основе префикса.
@@ -68,79 +109,73 @@ def get_subnet_mask(prefix):
     Возвращает:
         str: Маска подсети в десятичном формате (например, 255.255.255.0)
     """
-    # Создаем маску подсети в двоичном виде
-    binary_mask = "1" * prefix + "0" * (32 - prefix)
+    # Создаем маску подсети как 32-битное целое число
+    mask = (0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF
     
-    # Разбиваем двоичную маску на октеты
-    octets = [binary_mask[i:i+8] for i in range(0, 32, 8)]
-    
-    # Конвертируем каждый октет в десятичное число
-    decimal_octets = [str(int(octet, 2)) for octet in octets]
-    
-    # Объединяем октеты с помощью точки
-    return ".".join(decimal_octets)
+    # Конвертируем маску в точечно-десятичную нотацию одним вызовом inet_ntoa()
+    return socket.inet_ntoa(mask.to_bytes(4, "big"))
+
+# Таблица параметров для каждого префикса от /0 до /32:
+# _PREFIX_TABLE[префикс] = (маска как число, маска хостовой части,
+#                           маска в десятичном формате, количество хостов)
+_PREFIX_TABLE = tuple(
+    (
+        (0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF,
+        (1 << (32 - prefix)) - 1,
+        get_subnet_mask(prefix),
+        max(0, (1 << (32 - prefix)) - 2),
+    )
+    for prefix in range(33)
+)
 
-def get_network_range(ip_address, prefix):
+def get_network_range(ip_int, prefix):
     """
     Вычисляет начальный и конечный адрес подсети.
     
     Аргументы:
-        ip_address (str): IP-адрес
+        ip_int (int): IP-адрес как 32-битное целое число
         prefix (int): Длина префикса
     
     Возвращает:
         tuple: (начальный адрес, конечный адрес)
     """
-    # Разделяем IP-адрес на октеты и конвертируем в целые числа
-    octets = [int(octet) for octet in ip_address.split(".")]
-    
-    # Конвертируем IP в 32-битное целое число
-    ip_int = (octets[0] << 24) + (octets[1] << 16) + (octets[2] << 8) + octets[3]
-    
-    # Создаем маску подсети как целое число
-    mask_int = (2**32 - 1) - (2**(32 - prefix) - 1)
+    # Берем готовые маски сети и хостовой части из таблицы
+    mask_int, host_mask, _, _ = _PREFIX_TABLE[prefix]
     
     # Вычисляем начальный адрес сети (IP AND MASK)
     network_int = ip_int & mask_int
     
     # Вычисляем конечный адрес сети (NETWORK OR NOT MASK)
-    broadcast_int = network_int | (2**(32 - prefix) - 1)
-    
-    # Конвертируем начальный адрес обратно в точечно-десятичную нотацию
-    network_octets = [
-        (network_int >> 24) & 255,
-        (network_int >> 16) & 255,
-        (network_int >> 8) & 255,
-        network_int & 255
-    ]
-    network_address = ".".join(map(str, network_octets))
-    
-    # Конвертируем конечный адрес обратно в точечно-десятичную нотацию
-    broadcast_octets = [
-        (broadcast_int >> 24) & 255,
-        (broadcast_int >> 16) & 255,
-        (broadcast_int >> 8) & 255,
-        broadcast_int & 255
-    ]
-    broadcast_address = ".".join(map(str, broadcast_octets))
+    broadcast_int = network_int | host_mask
+    
+    # Конвертируем начальный и конечный адреса обратно в точечно-десятичную
+    # нотацию одним вызовом inet_ntoa() для каждого
+    network_address = socket.inet_ntoa(network_int.to_bytes(4, "big"))
+    broadcast_address = socket.inet_ntoa(broadcast_int.to_bytes(4, "big"))
     
     return network_address, broadcast_address
 
+@lru_cache(maxsize=1024)
 def analyze_ip(ip_address):
     """
     Анализирует IP-адрес и возвращает информацию о нем.
     
+    Результаты кэшируются по строке IP-адреса, поэтому повторные запросы
+    возвращают тот же самый словарь. Его нельзя изменять.
+    
     Аргументы:
         ip_address (str): IP-адрес для анализа
     
     Возвращает:
-        dict: Информация о сети
+        dict: Информация о сети (только для чтения)
     """
-    if not validate_ip(ip_address):
+    # Разбираем IP-адрес один раз и дальше работаем с целым числом
+    ip_int = _parse_ipv4(ip_address)
+    if ip_int is None:
         return {"error": "Неверный формат IP-адреса"}
     
     # Определяем класс IP-адреса и стандартный префикс для этого класса
-    ip_class, default_prefix = determine_ip_class(ip_address)
+    ip_class, default_prefix = determine_ip_class(ip_int)
     
     # Если класс D или E, не применяем стандартную маску
     if ip_class in ["D", "E", "Неизвестный"]:
@@ -151,14 +186,11 @@ def analyze_ip(ip_address):
         }
         return result
     
-    # Получаем маску подсети
-    subnet_mask = get_subnet_mask(default_prefix)
+    # Получаем маску подсети и количество хостов в сети из таблицы префиксов
+    _, _, subnet_mask, num_hosts = _PREFIX_TABLE[default_prefix]
     
     # Получаем начальный и конечный адрес сети
-    network_address, broadcast_address = get_network_range(ip_address, default_prefix)
-    
-    # Количество хостов в сети
-    num_hosts = 2**(32 - default_prefix) - 2
+    network_address, broadcast_address = get_network_range(ip_int, default_prefix)
     
     # Формируем результат
     result = {
@@ -180,60 +212,64 @@ def display_ip_info(ip_info):
     Аргументы:
         ip_info (dict): Информация о сети
     """
-    print("\n" + "=" * 60)
+    # Собираем строки и выводим их одной записью в stdout
+    parts = ["\n" + "=" * 60]
     
     if "error" in ip_info:
-        print(f"Ошибка: {ip_info['error']}")
-        return
-    
-    if "note" in ip_info:
-        print(f"IP-адрес: {ip_info['ip_address']}")
-        print(f"Класс IP: {ip_info['ip_class']}")
-        print(f"Примечание: {ip_info['note']}")
-        return
-    
-    print(f"IP-адрес:              {ip_info['ip_address']}")
-    print(f"Класс IP:              {ip_info['ip_class']}")
-    print(f"Префикс сети:          /{ip_info['network_prefix']}")
-    print(f"Маска подсети:         {ip_info['subnet_mask']}")
-    print(f"Начальный адрес сети:  {ip_info['network_address']}")
-    print(f"Конечный адрес сети:   {ip_info['broadcast_address']}")
-    print(f"Количество хостов:     {ip_info['usable_hosts']}")
-    
-    print("=" * 60)
+        parts.append(f"Ошибка: {ip_info['error']}")
+    elif "note" in ip_info:
+        parts.append(f"IP-адрес: {ip_info['ip_address']}")
+        parts.append(f"Класс IP: {ip_info['ip_class']}")
+        parts.append(f"Примечание: {ip_info['note']}")
+    else:
+        parts.append(f"IP-адрес:              {ip_info['ip_address']}")
+        parts.append(f"Класс IP:              {ip_info['ip_class']}")
+        parts.append(f"Префикс сети:          /{ip_info['network_prefix']}")
+        parts.append(f"Маска подсети:         {ip_info['subnet_mask']}")
+        parts.append(f"Начальный адрес сети:  {ip_info['network_address']}")
+        parts.append(f"Конечный адрес сети:   {ip_info['broadcast_address']}")
+        parts.append(f"Количество хостов:     {ip_info['usable_hosts']}")
+        parts.append("=" * 60)
+    
+    sys.stdout.write("\n".join(parts) + "\n")
 
 def explain_ip_classes():
     """
     Выводит информацию о классах IP-адресов.
     """
-    print("\n" + "-" * 60)
-    print("Информация о классах IP-адресов:")
-    print("-" * 60)
-    print("Класс A: 1.0.0.0 - 126.255.255.255")
-    print("         Маска подсети: 255.0.0.0 (префикс /8)")
-    print("         Первый бит: 0")
-    print("         Для крупных сетей (~16.7 млн хостов)")
-    print()
-    print("Класс B: 128.0.0.0 - 191.255.255.255")
-    print("         Маска подсети: 255.255.0.0 (префикс /16)")
-    print("         Первые два бита: 10")
-    print("         Для средних сетей (~65,5 тыс. хостов)")
-    print()
-    print("Класс C: 192.0.0.0 - 223.255.255.255")
-    print("         Маска подсети: 255.255.255.0 (префикс /24)")
-    print("         Первые три бита: 110")
-    print("         Для малых сетей (254 хоста)")
-    print()
-    print("Класс D: 224.0.0.0 - 239.255.255.255")
-    print("         Первые четыре бита: 1110")
-    print("         Для групповой адресации (мультикаст)")
-    print()
-    print("Класс E: 240.0.0.0 - 255.255.255.255")
-    print("         Первые четыре бита: 1111")
-    print("         Зарезервированы для экспериментальных целей")
-    print()
-    print("Адреса 127.0.0.0 - 127.255.255.255 зарезервированы для локальной обратной связи")
-    print("-" * 60)
+    # Собираем строки и выводим их одной записью в stdout
+    parts = [
+        "\n" + "-" * 60,
+        "Информация о классах IP-адресов:",
+        "-" * 60,
+        "Класс A: 1.0.0.0 - 126.255.255.255",
+        "         Маска подсети: 255.0.0.0 (префикс /8)",
+        "         Первый бит: 0",
+        "         Для крупных сетей (~16.7 млн хостов)",
+        "",
+        "Класс B: 128.0.0.0 - 191.255.255.255",
+        "         Маска подсети: 255.255.0.0 (префикс /16)",
+        "         Первые два бита: 10",
+        "         Для средних сетей (~65,5 тыс. хостов)",
+        "",
+        "Класс C: 192.0.0.0 - 223.255.255.255",
+        "         Маска подсети: 255.255.255.0 (префикс /24)",
+        "         Первые три бита: 110",
+        "         Для малых сетей (254 хоста)",
+        "",
+        "Класс D: 224.0.0.0 - 239.255.255.255",
+        "         Первые четыре бита: 1110",
+        "         Для групповой адресации (мультикаст)",
+        "",
+        "Класс E: 240.0.0.0 - 255.255.255.255",
+        "         Первые четыре бита: 1111",
+        "         Зарезервированы для экспериментальных целей",
+        "",
+        "Адреса 127.0.0.0 - 127.255.255.255 зарезервированы для локальной обратной связи",
+        "-" * 60,
+    ]
+    
+    sys.stdout.write("\n".join(parts) + "\n")
 
 def main():
     """